@@ -6,31 +6,38 @@ Syntax:
   mvn-testalot.py report  <-- Produces a Markdown report on stdout
 """
 
+import io
 import os
 import re
 import sys
 import enum
+import time
+import array
+import heapq
+import hashlib
+import pickle
 import shutil
 import pathlib
 import datetime
 import subprocess
+import concurrent.futures
 
-from typing import List, NamedTuple, Dict
+# lxml (libxml2) parses a few times faster than the standard library parser,
+# use it when installed. Both expose the same iterparse() API.
+try:
+    from lxml import etree as ET  # type: ignore
+except ImportError:
+    import xml.etree.ElementTree as ET  # type: ignore
+
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterator, List, Dict, Tuple
 
 
 # Number of entries to show in the slow-tests top list
 TOP_SLOW_TESTS = 10
 
 
-# Example: <testcase name="aclExcudeSingleCommand" classname="redis.clients.jedis.tests.commands.AccessControlListCommandsTest" time="0"/>
-TESTCASE = re.compile(r'  <testcase name="([^"]+)" classname="([^"]+)" time="([^"]+)"')
-
-# Example: <error message="ERR unknown command `ZMSCORE`, with args beginning with: `foo`, `b`, ...
-ERROR = re.compile(r"    <error ")
-
-# Example: <failure message="expected:&lt;4&gt; but was:&lt;3&gt;" type=...
-FAILURE = re.compile(r"    <failure ")
-
 # Example: target/testalot/surefire-reports-20210209T114442-3/TEST-com.spotify.ads.adserver.faf.FafQueryBuilderTest.xml
 # Capture: 20210209T114442
 TESTRUN_RE = re.compile(r".*/surefire-reports-([0-9T]+)(-[0-9]+)?/")
@@ -38,6 +45,22 @@ TESTRUN_RE = re.compile(r".*/surefire-reports-([0-9T]+)(-[0-9]+)?/")
 # Default place where to collect test reports.
 DEFAULT_DATA_PATH = "target/testalot"
 
+# Hardlinked clones of the working copy used by --parallel live here. Kept out
+# of DEFAULT_DATA_PATH so report collection never walks into them.
+WORKERS_PATH = "target/testalot-workers"
+
+# Parsed results are cached here between report runs. Surefire XML files are
+# immutable once archived, so a file with an unchanged mtime and size does not
+# need to be parsed again. The version suffix changes when the stored layout
+# does (v2: durations became integer nanoseconds), orphaning older caches.
+PARSE_CACHE_PATH = os.path.join(DEFAULT_DATA_PATH, ".parse_cache.v2.pkl")
+
+# Maximum number of files to remember in the parse cache
+PARSE_CACHE_MAX_ENTRIES = 100_000
+
+# Cache key: (absolute path, st_mtime_ns, st_size)
+ParseCacheKey = Tuple[str, int, int]
+
 
 class ResultKind(enum.Enum):
     PASS = enum.auto()
@@ -45,24 +68,61 @@ class ResultKind(enum.Enum):
     ERROR = enum.auto()
 
 
-class Result(NamedTuple):
+@dataclass
+class Results:
+    """
+    Test results in a struct-of-arrays layout.
+
+    Entry i of each field together describes one test result. Compared to a
+    list of per-result objects this keeps the kind and duration columns in
+    compact typed arrays, which the report loops scan by index.
+    """
+
     # Format: a.b.c.ClassName.testName()
-    name: str
+    names: List[str] = field(default_factory=list)
+
+    # ResultKind values, one signed byte each
+    kinds: array.array = field(default_factory=lambda: array.array("b"))
+
+    # Durations in integer nanoseconds
+    durations: array.array = field(default_factory=lambda: array.array("q"))
+
+    timestamps: List[datetime.datetime] = field(default_factory=list)
+
+    # File names with full path of the (XML) files where the results were read from.
+    paths: List[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.names)
 
-    kind: ResultKind
-    duration: datetime.timedelta
-    timestamp: datetime.datetime
+    def append(
+        self,
+        name: str,
+        kind: ResultKind,
+        duration_ns: int,
+        timestamp: datetime.datetime,
+        path: str,
+    ) -> None:
+        self.names.append(name)
+        self.kinds.append(kind.value)
+        self.durations.append(duration_ns)
+        self.timestamps.append(timestamp)
+        self.paths.append(path)
 
-    # File name with full path of the (XML) file where this test result was read from.
-    path: str
+    def extend(self, other: "Results") -> None:
+        self.names.extend(other.names)
+        self.kinds.extend(other.kinds)
+        self.durations.extend(other.durations)
+        self.timestamps.extend(other.timestamps)
+        self.paths.extend(other.paths)
 
 
-def surefire_reports() -> List[str]:
+def surefire_reports(root: str = ".") -> List[str]:
     """
     Find all directories named "target/surefire-reports" next to a "pom.xml" file.
     """
     surefire_reports = []
-    for dirpath, dirnames, filenames in os.walk("."):
+    for dirpath, dirnames, filenames in os.walk(root):
         for filename in filenames:
             if filename != "pom.xml":
                 continue
@@ -74,27 +134,111 @@ def surefire_reports() -> List[str]:
     return surefire_reports
 
 
-def mvn_test_times(count: int, command: List[str] = None) -> List[Result]:
-    global_start = datetime.datetime.now()
-    for i in range(count):
-        if not os.path.isfile("pom.xml"):
-            sys.exit("Must be in the root of the source tree, pom.xml not found")
+def clone_working_copy(worker_dir: str) -> None:
+    """
+    Clone the current working copy into worker_dir.
+
+    Source files are hardlinked rather than copied; build output is left out
+    so each worker builds into its own target/ directories.
+    """
+    shutil.copytree(
+        ".",
+        worker_dir,
+        copy_function=os.link,
+        ignore=shutil.ignore_patterns("target", ".git"),
+    )
+
+
+def mvn_test_times_parallel(count: int, command: List[str], parallel: int) -> Results:
+    """
+    Run the test iterations spread over several clones of the working copy,
+    collecting all surefire reports under DEFAULT_DATA_PATH just like the
+    serial path does.
+    """
+    worker_dirs = []
+    for number in range(1, parallel + 1):
+        worker_dir = os.path.join(WORKERS_PATH, f"worker-{number}")
+        if os.path.isdir(worker_dir):
+            shutil.rmtree(worker_dir)
+        clone_working_copy(worker_dir)
+        worker_dirs.append(worker_dir)
+
+    os.makedirs(DEFAULT_DATA_PATH, exist_ok=True)
+
+    global_start = time.monotonic()
+    runs_done = 0
+    while runs_done < count:
+        wave = worker_dirs[: min(parallel, count - runs_done)]
+
+        processes = []
+        for worker_dir in wave:
+            for surefire_reports_dir in surefire_reports(worker_dir):
+                shutil.rmtree(surefire_reports_dir)
+            processes.append(subprocess.Popen(args=command, cwd=worker_dir))
+
+        for process in processes:
+            process.wait()
+
+        reports_found = False
+        for worker_dir in wave:
+            # Microsecond resolution keeps run timestamps distinct between
+            # workers that finished in the same wave
+            timestamp = datetime.datetime.now().strftime("%Y%m%dT%H%M%S%f")
+
+            number = 1
+            for surefire_report in surefire_reports(worker_dir):
+                reports_found = True
+                shutil.move(
+                    surefire_report,
+                    f"{DEFAULT_DATA_PATH}/surefire-reports-{timestamp}-{number}",
+                )
+                number += 1
+
+        # If no tests were run, give up, it does not make sense to try again.
+        if not reports_found:
+            break
+
+        runs_done += len(wave)
+        runs_left = count - runs_done
+        if runs_left:
+            time_elapsed = time.monotonic() - global_start
+            time_left = datetime.timedelta(seconds=time_elapsed / runs_done * runs_left)
+            eta = datetime.datetime.now() + time_left
+            print(
+                f"mvn-testalot: {runs_left} runs left, expect finish at {eta.isoformat(timespec='seconds')}, {time_left} from now"
+            )
+
+    now = datetime.datetime.now()
+    print(f"mvn-testalot: All done at {now.isoformat(timespec='seconds')}")
+
+    return collect_results([DEFAULT_DATA_PATH])
+
+
+def mvn_test_times(count: int, command: List[str] = None, parallel: int = 1) -> Results:
+    if not os.path.isfile("pom.xml"):
+        sys.exit("Must be in the root of the source tree, pom.xml not found")
+
+    # If no command is given, use a sensible default.
+    if not command:
+        # --fail-never makes all tests run in a multi module project, even if
+        # earlier modules see test failures.
+        command = ["mvn", "--fail-never", "test"]
+
+    if parallel > 1:
+        return mvn_test_times_parallel(count, command, parallel)
 
+    # Durations come from the monotonic clock; wall-clock datetimes are only
+    # used where a human-readable point in time is shown or recorded
+    global_start = time.monotonic()
+    for i in range(count):
         for surefire_reports_dir in surefire_reports():
             shutil.rmtree(surefire_reports_dir)
 
-        start = datetime.datetime.now()
-
-        # If no command is given, use a sensible default.
-        if not command:
-            # --fail-never makes all tests run in a multi module project, even if
-            # earlier modules see test failures.
-            command = ["mvn", "--fail-never", "test"]
+        start = time.monotonic()
 
         result = subprocess.run(args=command)
 
-        end = datetime.datetime.now()
-        duration = end - start
+        duration = datetime.timedelta(seconds=time.monotonic() - start)
         print("")
         print(f"mvn-testalot: Exit code {result.returncode} after {duration}")
 
@@ -123,11 +267,9 @@ def mvn_test_times(count: int, command: List[str] = None) -> List[Result]:
         runs_left = count - 1 - i
         if runs_left:
             runs_done = i + 1
-            now = datetime.datetime.now()
-            time_elapsed = now - global_start
-            time_per_run = time_elapsed / runs_done
-            time_left = time_per_run * runs_left
-            eta = now + time_left
+            time_elapsed = time.monotonic() - global_start
+            time_left = datetime.timedelta(seconds=time_elapsed / runs_done * runs_left)
+            eta = datetime.datetime.now() + time_left
             print(
                 f"mvn-testalot: {runs_left} runs left, expect finish at {eta.isoformat(timespec='seconds')}, {time_left} from now"
             )
@@ -138,102 +280,232 @@ def mvn_test_times(count: int, command: List[str] = None) -> List[Result]:
     return collect_results([DEFAULT_DATA_PATH])
 
 
-def parse_xml(path: str):
-    results: List[Result] = []
-    current_test = None
-    result_kind = None
-    duration = None
+# Byte-identical XML files parse to the same testcases, and stable test suites
+# produce plenty of identical files across runs. Remember the content-derived
+# columns per content hash so repeated files skip the XML parser; only the
+# timestamp and path columns differ per file. Per process, bounded like the
+# on-disk parse cache.
+CONTENT_MEMO: Dict[bytes, Tuple[List[str], array.array, array.array]] = {}
+CONTENT_MEMO_MAX_ENTRIES = 10_000
+
+
+def parse_xml(path: str) -> Results:
+    results = Results()
 
     stat_result = pathlib.Path(path).stat()
     timestamp = datetime.datetime.fromtimestamp(
         stat_result.st_mtime, tz=datetime.timezone.utc
     )
 
-    for line in open(path, "r"):
-        if match := TESTCASE.match(line):
-            if current_test:
-                assert result_kind
-                assert timestamp
-                assert duration is not None
-                results.append(
-                    Result(current_test, result_kind, duration, timestamp, path)
-                )
-            testname = match.group(1)
-            classname = match.group(2)
-            duration = datetime.timedelta(
-                # Removing the "," to be able to handle "1,234.567" style numbers
-                seconds=float(match.group(3).replace(",", ""))
-            )
-            current_test = classname + "." + testname + "()"
-            result_kind = ResultKind.PASS
-            continue
+    # Surefire files are small, so slurp each one with a single read and let
+    # the parser work from memory instead of doing chunked reads from disk
+    with open(path, "rb") as xml_file:
+        xml_bytes = xml_file.read()
+
+    # Empty test suites are common enough to be worth a C-speed substring
+    # check before spinning up the XML parser
+    if b"<testcase" not in xml_bytes:
+        return results
+
+    digest = hashlib.sha1(xml_bytes).digest()
+    memo = CONTENT_MEMO.pop(digest, None)
+    if memo is not None:
+        # Seen this exact content before; re-insert so recently used entries
+        # end up last, then just rebind the timestamp and path columns
+        CONTENT_MEMO[digest] = memo
+        names, kinds, durations = memo
+        results.names.extend(names)
+        results.kinds.extend(kinds)
+        results.durations.extend(durations)
+        results.timestamps.extend([timestamp] * len(names))
+        results.paths.extend([path] * len(names))
+        return results
+
+    # Everything the loop body touches is bound to a local up front, and the
+    # appends go straight into the result columns. This is as close to a
+    # compiled inner loop as plain Python gets; the heavy lifting already
+    # happens inside the C-level XML parser.
+    names_append = results.names.append
+    kinds_append = results.kinds.append
+    durations_append = results.durations.append
+    timestamps_append = results.timestamps.append
+    paths_append = results.paths.append
+
+    pass_kind = ResultKind.PASS.value
+    fail_kind = ResultKind.FAIL.value
+    error_kind = ResultKind.ERROR.value
+
+    # A proper streaming XML parse rather than regex matching: the end events
+    # for <error> / <failure> children arrive before the end event of their
+    # <testcase> parent, so by the time we see the testcase we know its kind.
+    # This also copes with attributes in any order.
+    result_kind = pass_kind
+    try:
+        for _event, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("end",)):
+            tag = elem.tag
+            if tag == "error":
+                result_kind = error_kind
+            elif tag == "failure":
+                result_kind = fail_kind
+            elif tag == "testcase":
+                testname = elem.get("name")
+                classname = elem.get("classname")
+                time_s = elem.get("time")
+                assert testname is not None
+                assert classname is not None
+                assert time_s is not None
+
+                names_append(classname + "." + testname + "()")
+                kinds_append(result_kind)
+                # Removing the "," to be able to handle "1,234.567" style
+                # numbers, then storing whole nanoseconds
+                durations_append(int(float(time_s.replace(",", "")) * 1e9))
+                timestamps_append(timestamp)
+                paths_append(path)
+                result_kind = pass_kind
+
+                # Done with this testcase, free the element tree memory
+                elem.clear()
+    except SyntaxError:
+        # Interrupted mvn runs can leave truncated or empty XML files behind;
+        # keep whatever complete testcases we saw. Both the standard library's
+        # ParseError and lxml's XMLSyntaxError derive from SyntaxError.
+        pass
 
-        if ERROR.match(line):
-            result_kind = ResultKind.ERROR
-        elif FAILURE.match(line):
-            result_kind = ResultKind.FAIL
+    while len(CONTENT_MEMO) >= CONTENT_MEMO_MAX_ENTRIES:
+        del CONTENT_MEMO[next(iter(CONTENT_MEMO))]
+    CONTENT_MEMO[digest] = (results.names, results.kinds, results.durations)
 
-        # Unknown line, just ignore it
+    return results
 
-    if current_test:
-        assert timestamp
-        assert result_kind
-        assert duration is not None
-        results.append(Result(current_test, result_kind, duration, timestamp, path))
 
-    return results
+def load_parse_cache() -> Dict[ParseCacheKey, Results]:
+    try:
+        with open(PARSE_CACHE_PATH, "rb") as cache_file:
+            return pickle.load(cache_file)
+    except (OSError, pickle.PickleError, EOFError, AttributeError):
+        # No cache yet, or an unreadable / outdated one; start over
+        return {}
+
+
+def save_parse_cache(cache: Dict[ParseCacheKey, Results]) -> None:
+    # Dicts iterate in insertion order and lookups below re-insert on use, so
+    # dropping from the front evicts the least recently used entries.
+    while len(cache) > PARSE_CACHE_MAX_ENTRIES:
+        del cache[next(iter(cache))]
+
+    os.makedirs(os.path.dirname(PARSE_CACHE_PATH), exist_ok=True)
+    with open(PARSE_CACHE_PATH, "wb") as cache_file:
+        pickle.dump(cache, cache_file)
+
+
+def iter_xml_files(root: str) -> Iterator[str]:
+    """
+    Yield all .xml files under root, recursively.
+
+    os.scandir exposes each entry's type without a separate stat call, unlike
+    the os.walk + filename checks this replaces. Missing or unreadable
+    directories are silently skipped, matching os.walk's default behavior.
+    """
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_xml_files(entry.path)
+            elif entry.name.endswith(".xml"):
+                yield entry.path
 
 
-def collect_results(paths: List[str]) -> List[Result]:
+def collect_results(paths: List[str]) -> Results:
     if not paths:
         paths = [DEFAULT_DATA_PATH]
-    results = []
+
+    xml_paths = []
     for path in paths:
         if os.path.isfile(path):
             if path.endswith(".xml"):
-                results += parse_xml(path)
-                continue
-
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                file_with_path = os.path.join(dirpath, filename)
-                if not file_with_path.endswith(".xml"):
-                    continue
+                xml_paths.append(path)
+        else:
+            xml_paths.extend(iter_xml_files(path))
+
+    cache = load_parse_cache()
+
+    cache_keys: Dict[str, ParseCacheKey] = {}
+    misses: List[str] = []
+    for path in xml_paths:
+        stat_result = os.stat(path)
+        cache_key = (
+            os.path.abspath(path),
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+        )
+        cache_keys[path] = cache_key
+        if cache_key not in cache:
+            misses.append(path)
+
+    # Each XML file can be parsed independently, so spread the work across all
+    # cores. The chunksize keeps the per-task IPC overhead down.
+    parsed: Dict[str, Results] = {}
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        for path, file_results in zip(
+            misses, executor.map(parse_xml, misses, chunksize=16)
+        ):
+            parsed[path] = file_results
+
+    results = Results()
+    for path in xml_paths:
+        cache_key = cache_keys[path]
+        if path in parsed:
+            file_results = parsed[path]
+        else:
+            # Pop and re-insert so recently used entries end up last, keeping
+            # the eviction in save_parse_cache() least-recently-used
+            file_results = cache.pop(cache_key)
+        cache[cache_key] = file_results
+        results.extend(file_results)
 
-                results += parse_xml(file_with_path)
+    save_parse_cache(cache)
 
     return results
 
 
-def print_slow_tests_report(results: List[Result]) -> None:
-    slow_results: Dict[str, Result] = {}
-    fast_results: Dict[str, Result] = {}
+def print_slow_tests_report(results: Results) -> None:
+    names = results.names
+    durations = results.durations
 
-    # Figure out max duration for each test case
-    for current_result in results:
-        slow_result = slow_results.get(current_result.name, None)
-        if slow_result is None or current_result.duration > slow_result.duration:
-            slow_result = current_result
-        slow_results[current_result.name] = slow_result
+    # Index of the slowest / fastest run of each test case, plus total time
+    # spent per test case, all grouped by test name in a single pass
+    slow_indices: Dict[str, int] = {}
+    fast_indices: Dict[str, int] = {}
+    time_per_test: Dict[str, int] = {}
 
-        fast_result = fast_results.get(current_result.name, None)
-        if fast_result is None or current_result.duration < fast_result.duration:
-            fast_result = current_result
-        fast_results[current_result.name] = fast_result
+    total_time = 0
+    for i in range(len(results)):
+        name = names[i]
+        duration = durations[i]
+        total_time += duration
 
-    print_these = sorted(slow_results.values(), key=lambda r: r.duration, reverse=True)[
-        :TOP_SLOW_TESTS
-    ]
+        slow_index = slow_indices.get(name, None)
+        if slow_index is None or duration > durations[slow_index]:
+            slow_indices[name] = i
 
-    slow_testnames = list(map(lambda result: result.name, print_these))
-    total_time = datetime.timedelta(0)
-    time_spent_in_slow_tests = datetime.timedelta(0)
+        fast_index = fast_indices.get(name, None)
+        if fast_index is None or duration < durations[fast_index]:
+            fast_indices[name] = i
+
+        time_per_test[name] = time_per_test.get(name, 0) + duration
+
+    # Only the top few entries are shown, no need to sort all of them
+    print_these = heapq.nlargest(
+        TOP_SLOW_TESTS, slow_indices.values(), key=lambda i: durations[i]
+    )
 
     if results:
-        for current_result in results:
-            total_time += current_result.duration
-            if current_result.name in slow_testnames:
-                time_spent_in_slow_tests += current_result.duration
+        time_spent_in_slow_tests = sum(time_per_test[names[i]] for i in print_these)
         slow_test_percentage = int((time_spent_in_slow_tests * 100) / total_time)
     else:
         slow_test_percentage = 0
@@ -254,79 +526,79 @@ def print_slow_tests_report(results: List[Result]) -> None:
     print("")
     print("| Result |    Duration   | Name |")
     print("|--------|---------------|------|")
-    for result in print_these:
-        slow_duration_s = f"{result.duration.total_seconds():.1f}s"
-        fast_duration_s = f"{fast_results[result.name].duration.total_seconds():.1f}s"
+    for i in print_these:
+        name = names[i]
+        slow_duration_s = f"{durations[i] / 1e9:.1f}s"
+        fast_duration_s = f"{durations[fast_indices[name]] / 1e9:.1f}s"
         duration_s = f"{slow_duration_s:>6s} ({fast_duration_s})"
-        result_s = result.kind.name
-        if result.kind is ResultKind.PASS:
+        kind = ResultKind(results.kinds[i])
+        result_s = kind.name
+        if kind is ResultKind.PASS:
             result_s = "ok"
-        print(f"| {result_s:6s} | {duration_s} | `{result.name}` |")
-
-
-def is_flaky(string: str) -> bool:
-    if not string:
-        return False
+        print(f"| {result_s:6s} | {duration_s} | `{name}` |")
 
-    first_char = string[0]
-    for char in string:
-        if char != first_char:
-            # Multiple kinds of results, we have a flake!
-            return True
 
-    return False
-
-
-def count_runs(results: List[Result]) -> int:
+def count_runs(results: Results) -> int:
     timestamps = set()
-    for result in results:
+    for path in results.paths:
         # Example: target/testalot/surefire-reports-20210209T114442-1/TEST-com.spotify.ads.adserver.faf.FafQueryBuilderTest.xml
-        timestamp_match = TESTRUN_RE.match(result.path)
+        timestamp_match = TESTRUN_RE.match(path)
         if not timestamp_match:
-            print(result.path, file=sys.stderr)
+            print(path, file=sys.stderr)
             assert timestamp_match
         timestamps.add(timestamp_match.group(1))
 
     return len(timestamps)
 
 
-def print_flaky_tests_report(results: List[Result]) -> None:
-    result_strings: Dict[str, str] = {}
-    for result in sorted(results, key=lambda r: r.timestamp):
-        string = result_strings.get(result.name, "")
-        if result.kind == ResultKind.PASS:
-            string += "."
-        elif result.kind == ResultKind.FAIL:
-            string += "x"
-        elif result.kind == ResultKind.ERROR:
-            string += "E"
-        else:
-            assert False
-        result_strings[result.name] = string
+def print_flaky_tests_report(results: Results) -> None:
+    names = results.names
+    kinds = results.kinds
 
-    flakies = {}
-    for name, string in result_strings.items():
-        if is_flaky(string):
-            flakies[name] = string
+    # A test is flaky if not all of its runs had the same result kind. One
+    # Counter update per result finds the distinct (name, kind) pairs, then a
+    # second small pass counts distinct kinds per name.
+    kind_counts = Counter(zip(names, kinds))
+    kinds_per_name = Counter(name for name, _kind in kind_counts)
+    flaky_names = {name for name, distinct in kinds_per_name.items() if distinct > 1}
 
-    print("")
-    print(f"# Flaky tests, {count_runs(results)} runs")
-    print("")
+    # Only the (few) flaky tests need their runs laid out in time order
+    flaky_indices = [i for i in range(len(results)) if names[i] in flaky_names]
+    flaky_indices.sort(key=lambda i: results.timestamps[i])
 
-    if not flakies:
-        print("No flaky tests found.")
-        return
+    kind_chars = {
+        ResultKind.PASS.value: ".",
+        ResultKind.FAIL.value: "x",
+        ResultKind.ERROR.value: "E",
+    }
+    result_strings: Dict[str, str] = {}
+    for i in flaky_indices:
+        name = names[i]
+        result_strings[name] = result_strings.get(name, "") + kind_chars[kinds[i]]
+
+    # This table can run to thousands of rows, so build the lines up front and
+    # write them to stdout in one go rather than one print call per row
+    out = []
+    out.append("")
+    out.append(f"# Flaky tests, {count_runs(results)} runs")
+    out.append("")
+
+    if not result_strings:
+        out.append("No flaky tests found.")
+    else:
+        out.append("`.` = pass, `x` = fail, `E` = error")
+        out.append("")
+        out.append("| Result | Name |")
+        out.append("|--------|------|")
+        for name in sorted(result_strings.keys()):
+            string = result_strings[name]
+            out.append(f"| `{string}` | `{name}` |")
 
-    print("`.` = pass, `x` = fail, `E` = error")
-    print("")
-    print("| Result | Name |")
-    print("|--------|------|")
-    for name in sorted(flakies.keys()):
-        string = result_strings[name]
-        print(f"| `{string}` | `{name}` |")
+    out.append("")
+    sys.stdout.write("\n".join(out))
 
 
-def print_report(results: List[Result]) -> None:
+def print_report(results: Results) -> None:
     print_slow_tests_report(results)
     print_flaky_tests_report(results)
 
@@ -334,16 +606,31 @@ def print_report(results: List[Result]) -> None:
 def wipe_collected_data() -> None:
     if os.path.isdir(DEFAULT_DATA_PATH):
         shutil.rmtree(DEFAULT_DATA_PATH)
+    if os.path.isdir(WORKERS_PATH):
+        shutil.rmtree(WORKERS_PATH)
 
 
 def main(args: List[str]) -> None:
     if len(args) == 1:
         print("Usage:")
         print(f"{args[0]} <count_runs>          # Run the tests, collect the results and print a report")
+        print(f"{args[0]} <count_runs> --parallel <n>   # Same, but spread the runs over n clones of the working copy")
         print(f"{args[0]} report [<path> ...]   # Print a report of previously collected results")
         print(f"{args[0]} clean                 # Clean previously collected data")
         sys.exit(0)
 
+    args = list(args)
+    parallel = 1
+    if "--parallel" in args:
+        index = args.index("--parallel")
+        try:
+            parallel = int(args[index + 1])
+        except (IndexError, ValueError):
+            sys.exit("--parallel requires a number of workers")
+        if parallel < 1:
+            sys.exit("--parallel requires at least one worker")
+        del args[index : index + 2]
+
     count = None
     try:
         count = int(args[1])
@@ -352,7 +639,7 @@ def main(args: List[str]) -> None:
         pass
 
     if count:
-        results = mvn_test_times(count, args[2:])
+        results = mvn_test_times(count, args[2:], parallel)
         print_report(results)
         sys.exit(0)
 